@@ -9,20 +9,40 @@ approximately the expected columns. It's intentionally permissive about numeric
 values.
 """
 from __future__ import annotations
+import mmap
 import sys
 from pathlib import Path
+from statistics import median_low
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _is_header(line: bytes) -> bool:
+    # Record headers start with a >=5 digit program id followed by a space.
+    return (line[:1].isdigit() and (sp := line.find(b' ')) >= 5
+            and line[:sp].isdigit())
 
 
 def parse_records(path: Path):
-    """Return a list of records, where each record is a list of lines (strings)."""
+    """Return a list of records, where each record is a list of lines (bytes)."""
     recs = []
     cur = []
-    with path.open('r', encoding='utf-8', errors='ignore') as fh:
-        for line in fh:
-            line = line.rstrip('\n')
+    with path.open('rb') as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            return recs
+        with mm:
+            # One pass over the mapped bytes; no per-line UTF-8 decode.
+            lines = mm[:].splitlines()
+        for line in lines:
             if not line:
                 continue
-            if line and line[0].isdigit() and ' ' in line and line.split()[0].isdigit() and len(line.split()[0]) >= 5:
+            if _is_header(line):
                 # crude header detection: starts with program id digits
                 if cur:
                     recs.append(cur)
@@ -37,15 +57,21 @@ def parse_records(path: Path):
     return recs
 
 
+def _median(values):
+    # numpy's C quickselect is O(N); median_low is the stdlib fallback.
+    if np is not None:
+        return int(np.median(np.fromiter(values, dtype=np.int64)))
+    return int(median_low(values))
+
+
 def check_layout(sample_recs, gen_recs, date_col=7, time_col=18, tol=2):
-    from statistics import median
     sample_conts = [len(r) - 1 for r in sample_recs if len(r) > 0]
     gen_conts = [len(r) - 1 for r in gen_recs if len(r) > 0]
     if not sample_conts or not gen_conts:
         print('No records to compare')
         return False
-    samp_med = int(median(sample_conts))
-    gen_med = int(median(gen_conts))
+    samp_med = _median(sample_conts)
+    gen_med = _median(gen_conts)
     print(f'sample median cont lines: {samp_med}, generated median cont lines: {gen_med}')
 
     # sample a subset and ensure date/time tokens exist near expected columns
@@ -54,7 +80,7 @@ def check_layout(sample_recs, gen_recs, date_col=7, time_col=18, tol=2):
             return False
         d = line0[date_col-1:date_col+9]
         t = line0[time_col-1:time_col+8]
-        return ('-' in d) and (':' in t)
+        return (b'-' in d) and (b':' in t)
 
     checks = 0
     passed = 0
@@ -5,17 +5,28 @@ absolute/local filesystem assumptions: defaults are repository-relative and
 all paths may be passed on the command line.
 
 Usage:
-  python csv_to_prv.py input.csv output.prv [layout.json]
+  python csv_to_prv.py input.csv output.prv [layout.json] [--jobs N]
 If layout.json is not provided the script will look for `layout.json` next to
-this script.
+this script. With --jobs N the row-at-a-time converter fans out over N worker
+processes.
 """
 from __future__ import annotations
 import csv
+import math
+import multiprocessing
 import sys
+from datetime import datetime
 from pathlib import Path
-from collections import defaultdict
+from functools import lru_cache
 import json
 
+try:
+    import numba
+    from numba import prange
+except ImportError:
+    numba = None
+    prange = range
+
 # Defaults (repo-relative)
 HERE = Path(__file__).resolve().parent
 CSV_DEFAULT = HERE / "sample.csv"
@@ -24,6 +35,12 @@ LAYOUT_JSON = HERE / "layout.json"
 
 SENSOR_COUNT = 22
 
+# Zero (and blank, which maps to zero) is by far the most common sensor
+# value, so its fixed-width representation is precomputed per field width.
+_ZERO_REP = '.00000E+0'
+_ZERO_STRS = {w: (_ZERO_REP[-w:] if len(_ZERO_REP) > w else _ZERO_REP).rjust(w)
+              for w in range(1, 20)}
+
 
 def fmt_exp_field(val, width=10) -> str:
     # simplified, robust exponential formatter inspired by the original
@@ -34,20 +51,59 @@ def fmt_exp_field(val, width=10) -> str:
             mant = float(val)
     except Exception:
         mant = 0.0
-
+    if not math.isfinite(mant):
+        # inf/nan have no fixed-width representation; emit the zero one.
+        mant = 0.0
     if mant == 0.0:
+        z = _ZERO_STRS.get(width)
+        if z is not None:
+            return z
+    return _fmt_exp_cached(mant, width)
+
+
+@lru_cache(maxsize=65536)
+def _fmt_exp_cached(mant: float, width: int) -> str:
+    # Telemetry channels repeat values heavily (zeros, sentinels, slowly
+    # changing readouts), so memoizing on (value, width) turns most calls
+    # into a cache hit. Used by the pure-Python path only; the batched
+    # kernel formats without building strings at all.
+    if mant == 0.0 or not math.isfinite(mant):
         rep = '.00000E+0'
     else:
         sign = '-' if mant < 0 else ''
         a = abs(mant)
+        # Constant-time exponent via log10 instead of repeated division;
+        # large values normalize into [1, 10), small ones into [0.1, 1),
+        # matching the old loops. Scaling happens in two half-power steps so
+        # 10.0 ** exp never under/overflows for denormal or huge inputs, and
+        # the snap comparisons absorb log10/pow rounding at decade boundaries.
         exp = 0
-        while a >= 10.0:
-            a /= 10.0; exp += 1
-        while a < 0.1 and a != 0.0:
-            a *= 10.0; exp -= 1
-        mantissa = f"{a:.5f}"
-        if mantissa.startswith('0'):
-            mantissa = mantissa[1:]
+        if a >= 10.0:
+            exp = int(math.floor(math.log10(a)))
+            a /= 10.0 ** (exp // 2)
+            a /= 10.0 ** (exp - exp // 2)
+            while a >= 10.0:
+                a *= 0.1; exp += 1
+            while a < 1.0:
+                a *= 10.0; exp -= 1
+        elif a < 0.1:
+            exp = int(math.floor(math.log10(a))) + 1
+            a /= 10.0 ** (exp // 2)
+            a /= 10.0 ** (exp - exp // 2)
+            while a < 0.1:
+                a *= 10.0; exp -= 1
+            while a >= 1.0:
+                a *= 0.1; exp += 1
+        # Round via the same integer the batched kernel uses so both paths
+        # pick the same side of ties; '%.5f' rounds the raw double instead
+        # of a * 100000.0 and can differ by one ulp on tie-adjacent values.
+        m = round(a * 100000.0)
+        if m == 1000000:
+            # rounding the sixth digit crossed a decade boundary
+            m = 100000
+            exp += 1
+        lead, frac = divmod(m, 100000)
+        mantissa = f"{lead}.{frac:05d}" if lead else f".{frac:05d}"
         exp_sign = '+' if exp >= 0 else '-'
         rep = f"{sign}{mantissa}E{exp_sign}{abs(exp)}"
     if len(rep) > width:
@@ -55,24 +111,232 @@ def fmt_exp_field(val, width=10) -> str:
     return rep.rjust(width)
 
 
+def _fmt_exp_batch(vals, starts, widths, out):
+    """Format a (N, sensors) float matrix into fixed-width ASCII byte rows.
+
+    For record i, sensor j, writes the same representation as
+    ``fmt_exp_field(vals[i, j], widths[j])`` into
+    ``out[i, starts[j]:starts[j] + widths[j]]``. Fields are emitted
+    right-to-left so over-long representations lose their leftmost
+    characters, matching the scalar formatter's ``rep[-width:]`` truncation.
+    Pure numeric code so it can be JIT-compiled by numba when available.
+    """
+    for i in prange(vals.shape[0]):
+        row = out[i]
+        for j in range(starts.shape[0]):
+            val = vals[i, j]
+            start = starts[j]
+            width = widths[j]
+            if val == 0.0 or not math.isfinite(val):
+                # zero, nan and +/-inf all collapse to the zero representation
+                negative = False
+                exp = 0
+                m = 0
+            else:
+                negative = val < 0.0
+                a = -val if negative else val
+                # Same log10-based normalization as fmt_exp_field.
+                exp = 0
+                if a >= 10.0:
+                    exp = int(math.floor(math.log10(a)))
+                    a /= 10.0 ** (exp // 2)
+                    a /= 10.0 ** (exp - exp // 2)
+                    while a >= 10.0:
+                        a *= 0.1
+                        exp += 1
+                    while a < 1.0:
+                        a *= 10.0
+                        exp -= 1
+                elif a < 0.1:
+                    exp = int(math.floor(math.log10(a))) + 1
+                    a /= 10.0 ** (exp // 2)
+                    a /= 10.0 ** (exp - exp // 2)
+                    while a < 0.1:
+                        a *= 10.0
+                        exp -= 1
+                    while a >= 1.0:
+                        a *= 0.1
+                        exp += 1
+                m = int(round(a * 100000.0))
+                if m == 1000000:
+                    # rounding the sixth digit crossed a decade boundary
+                    m = 100000
+                    exp += 1
+            p = start + width - 1
+            # exponent digits, least significant first
+            e = -exp if exp < 0 else exp
+            if e == 0:
+                if p >= start:
+                    row[p] = 48
+                    p -= 1
+            while e > 0:
+                if p >= start:
+                    row[p] = 48 + e % 10
+                    p -= 1
+                e //= 10
+            if p >= start:
+                row[p] = 45 if exp < 0 else 43  # exponent sign
+                p -= 1
+            if p >= start:
+                row[p] = 69  # 'E'
+                p -= 1
+            # five fractional mantissa digits
+            frac = m % 100000
+            for _ in range(5):
+                if p >= start:
+                    row[p] = 48 + frac % 10
+                    p -= 1
+                frac //= 10
+            if p >= start:
+                row[p] = 46  # '.'
+                p -= 1
+            # leading mantissa digit(s); a leading zero is omitted
+            lead = m // 100000
+            while lead > 0:
+                if p >= start:
+                    row[p] = 48 + lead % 10
+                    p -= 1
+                lead //= 10
+            if negative and p >= start:
+                row[p] = 45
+
+
+if numba is not None:
+    fmt_exp_batch = numba.njit(cache=True, parallel=True)(_fmt_exp_batch)
+else:
+    fmt_exp_batch = _fmt_exp_batch
+
+
 def load_layout(path: Path):
     if not path.exists():
         return None
     return json.loads(path.read_text(encoding='utf-8'))
 
 
-def place_into_line(buf: list, span, text: str):
-    start, end = span
-    width = end - start + 1
-    s = str(text)
-    if len(s) > width:
-        s = s[:width]
-    s = s.rjust(width)
-    for i, ch in enumerate(s):
-        buf[start - 1 + i] = ch
+def place_into_line(buf: bytearray, start0: int, width: int, text: str) -> int:
+    b = str(text).encode('ascii', 'replace')
+    buf[start0:start0 + width] = b[:width].rjust(width)
+    return start0 + width
+
+
+def _convert_vectorized(csv_path: Path, out_path: Path, layout) -> int | None:
+    """Vectorized CSV -> PRV conversion using pandas/numpy.
+
+    Formats whole columns at a time instead of dispatching per field. Returns
+    the record count, or None when pandas/numpy are unavailable or the input
+    does not fit the layout, in which case the caller falls back to the
+    row-at-a-time loop.
+    """
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        return None
+
+    line_spans = [l['common_spans'] for l in layout.get('lines', [])]
+    if sum(len(s) for s in line_spans) < SENSOR_COUNT:
+        # Not enough span capacity; the fallback-line logic only exists in
+        # the row-at-a-time path.
+        return None
+
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    sensor_cols = [str(i) for i in range(1, SENSOR_COUNT + 1)]
+    needed = ['Program', 'PTT', 'Satellite', 'Message date', 'Compression index']
+    if any(c not in df.columns for c in needed + sensor_cols):
+        return None
+    n = len(df)
+    if n == 0:
+        out_path.write_bytes(b'')
+        return 0
+
+    # Stable-sort by (Program, PTT) so records of one platform are contiguous
+    # and message indices follow from position; matches the row-at-a-time path.
+    keys = pd.DataFrame({'p': df['Program'].str.strip(),
+                         't': df['PTT'].str.strip()})
+    order = keys.sort_values(['p', 't'], kind='stable').index
+    df = df.loc[order].reset_index(drop=True)
+
+    msg_idx = df.groupby([df['Program'].str.strip(), df['PTT'].str.strip()],
+                         sort=False).cumcount() + 1
+    header = (df['Program'].str.zfill(5) + ' ' + df['PTT'].str.zfill(6) + '  '
+              + msg_idx.astype(str).str.rjust(3) + ' '
+              + str(SENSOR_COUNT).rjust(2) + ' '
+              + df['Satellite'].str.strip().str.ljust(1))
+
+    raw_date = df['Message date']
+    dt = pd.to_datetime(raw_date, format='%d/%m/%Y %H:%M', errors='coerce')
+    dt_time = dt.dt.strftime('%H:%M:00')
+    rest = dt.isna() & (raw_date != '')
+    if rest.any():
+        dt2 = pd.to_datetime(raw_date[rest], format='%d/%m/%Y %H:%M:%S',
+                             errors='coerce')
+        dt = dt.fillna(dt2)
+        dt_time = dt_time.where(~rest, dt2.dt.strftime('%H:%M:%S'))
+    dt_date = dt.dt.strftime('%Y-%m-%d').fillna('0000-00-00')
+    dt_time = dt_time.fillna('00:00:00')
+
+    comp = df['Compression index'].where(df['Compression index'] != '', '1')
+    # Encode up front so the S-dtype conversion below cannot trip over
+    # non-ASCII input; 'replace' matches place_into_line in the scalar path.
+    comp = comp.str.slice(0, 1).str.encode('ascii', 'replace')
+
+    # (N, 22) float matrix of sensor values; blanks/junk become 0.0 exactly
+    # as in the scalar path.
+    vals = df[sensor_cols].apply(pd.to_numeric, errors='coerce')
+    vals = vals.fillna(0.0).to_numpy(dtype=float)
 
+    # Each record's continuation lines become one fixed-size byte block
+    # (newlines included); sensor fields get absolute offsets into it.
+    line_length = layout.get('line_length', 78)
+    stride = line_length + 1
+    starts = np.empty(SENSOR_COUNT, dtype=np.int64)
+    widths = np.empty(SENSOR_COUNT, dtype=np.int64)
+    sens_idx = 0
+    n_lines = 0
+    for li, spans in enumerate(line_spans):
+        if sens_idx >= SENSOR_COUNT:
+            break
+        n_lines = li + 1
+        for start, end in spans:
+            if sens_idx >= SENSOR_COUNT:
+                break
+            starts[sens_idx] = li * stride + start - 1
+            widths[sens_idx] = end - start + 1
+            sens_idx += 1
 
-def convert(csv_path: Path, out_path: Path, layout_path: Path | None = None) -> int:
+    block_len = n_lines * stride
+    block = np.full((n, block_len), 32, dtype=np.uint8)
+    for li in range(n_lines):
+        block[:, li * stride + line_length] = 10
+
+    def _bytes_field(series, col, width):
+        arr = np.asarray(series.to_numpy(), dtype=f'S{width}')
+        block[:, col:col + width] = arr.view(np.uint8).reshape(n, width)
+
+    _bytes_field(dt_date, 6, 10)
+    _bytes_field(dt_time, 17, 8)
+    _bytes_field(comp, 27, 1)
+
+    fmt_exp_batch(vals, starts, widths, block)
+
+    # Trim trailing pad spaces from continuation lines only; headers keep
+    # theirs (a blank Satellite leaves one), matching the row-at-a-time path.
+    blob_lines = block.tobytes().split(b'\n')
+    headers = header.to_numpy()
+    chunks = []
+    for i in range(n):
+        chunks.append(headers[i].encode('ascii', 'replace'))
+        chunks.append(b'\n')
+        for line in blob_lines[i * n_lines:(i + 1) * n_lines]:
+            chunks.append(line.rstrip())
+            chunks.append(b'\n')
+    with open(out_path, 'wb') as out:
+        out.write(b''.join(chunks))
+    return n
+
+
+def convert(csv_path: Path, out_path: Path, layout_path: Path | None = None,
+            jobs: int = 1) -> int:
     csv_path = Path(csv_path)
     out_path = Path(out_path)
     layout_path = Path(layout_path) if layout_path else LAYOUT_JSON
@@ -84,89 +348,226 @@ def convert(csv_path: Path, out_path: Path, layout_path: Path | None = None) ->
         print(f"layout.json not found at {layout_path}")
         return 2
 
+    if jobs <= 1:
+        row_count = _convert_vectorized(csv_path, out_path, layout)
+        if row_count is not None:
+            print(f"Wrote {row_count} records to {out_path}")
+            return 0
+
     cont_lines = layout.get('most_common_cont_lines', 6)
-    line_spans = [l['common_spans'] for l in layout.get('lines', [])]
+    # All layout-derived values are hoisted out of the row loop; spans become
+    # zero-based (start, width) pairs so the hot path never re-derives them.
+    span_tables = [tuple((s - 1, e - s + 1) for s, e in line['common_spans'])
+                   for line in layout.get('lines', [])]
+    fallback_spans = tuple((s - 1, e - s + 1)
+                           for s, e in ((7, 16), (18, 25), (28, 36),
+                                        (37, 45), (46, 54), (55, 63)))
+
+    line_length = layout.get('line_length', 78)
+    blank = b' ' * line_length
+    # Sensor count is constant, so bake it into a single %-template; one
+    # C-level format call replaces the zfill/rjust/ljust chain per row.
+    header_fmt = f"%05d %06d  %3d {str(SENSOR_COUNT).rjust(2)} %-1s"
+
+    # Specialize the layout into one %-template per continuation line, so the
+    # hot loop fills each line with a single C-level interpolation instead of
+    # buffer placement. Slots record what feeds each field, in column order;
+    # templates end at their last field, which also subsumes the old rstrip.
+    line_templates = []
+    remaining = SENSOR_COUNT
+    for li, spans in enumerate(span_tables):
+        if remaining <= 0:
+            break
+        fields = [(start0, w, 'sensor') for start0, w in spans[:remaining]]
+        remaining -= len(fields)
+        if li == 0:
+            fields += [(6, 10, 'date'), (17, 8, 'time'), (27, 1, 'comp')]
+        fields.sort()
+        parts = []
+        slots = []
+        col = 0
+        for start0, w, kind in fields:
+            if start0 > col:
+                parts.append(' ' * (start0 - col))
+            parts.append(f'%{w}.{w}s')
+            slots.append((kind, w))
+            col = start0 + w
+        line_templates.append((''.join(parts), tuple(slots)))
 
-    groups = defaultdict(int)
-    with csv_path.open(newline='') as fh, out_path.open('w', newline='') as out:
-        reader = csv.DictReader(fh)
-        row_count = 0
-        for row in reader:
-            key = (row.get('Program', '').strip(), row.get('PTT', '').strip())
-            groups[key] += 1
-            msg_index = groups[key]
-
-            program = str(row.get('Program', '')).zfill(5)
-            ptt = str(row.get('PTT', '')).zfill(6)
-            msg_idx_s = str(msg_index).rjust(3)
-            sensor_cnt = str(SENSOR_COUNT).rjust(2)
-            sat = str(row.get('Satellite', '')).strip().ljust(1)
-            header = f"{program} {ptt}  {msg_idx_s} {sensor_cnt} {sat}"
-            out.write(header + '\n')
-
-            sensors = [row.get(str(i), '') for i in range(1, SENSOR_COUNT + 1)]
-            msgdate = row.get('Message date', '')
-            dt_date = '0000-00-00'; dt_time = '00:00:00'
+    with csv_path.open(newline='') as fh:
+        reader = csv.reader(fh)
+        header_row = next(reader, [])
+        idx = {name: i for i, name in enumerate(header_row)}
+        # Missing columns map to a pad slot so lookups stay plain indexing.
+        pad_i = len(header_row)
+        prog_i = idx.get('Program', pad_i)
+        ptt_i = idx.get('PTT', pad_i)
+        sat_i = idx.get('Satellite', pad_i)
+        date_i = idx.get('Message date', pad_i)
+        comp_i = idx.get('Compression index', pad_i)
+        sensor_idxs = tuple(idx.get(str(i), pad_i)
+                            for i in range(1, SENSOR_COUNT + 1))
+        # csv.reader yields [] for blank lines; skip them like DictReader did.
+        rows = [r if len(r) > pad_i else r + [''] * (pad_i + 1 - len(r))
+                for r in reader if r]
+
+    # Sort rows once by (Program, PTT); message indices then come from a
+    # run-length counter instead of a per-row dict lookup. Python's sort
+    # is stable, so rows of one platform keep their CSV order. Fixing the
+    # indices up front also makes rendering independent per row.
+    rows.sort(key=lambda r: (r[prog_i].strip(), r[ptt_i].strip()))
+    msg_idxs = []
+    last_key = None
+    msg_index = 0
+    for row in rows:
+        key = (row[prog_i].strip(), row[ptt_i].strip())
+        if key != last_key:
+            last_key = key
+            msg_index = 0
+        msg_index += 1
+        msg_idxs.append(msg_index)
+
+    ctx = (prog_i, ptt_i, sat_i, date_i, comp_i, sensor_idxs,
+           header_fmt, line_templates, fallback_spans, blank)
+    if jobs > 1 and len(rows) > 1:
+        # Contiguous row chunks render in worker processes to per-worker
+        # part files, which are concatenated in order.
+        k = min(jobs, len(rows))
+        step = (len(rows) + k - 1) // k
+        parts = [out_path.with_name(f'{out_path.name}.part{w}')
+                 for w in range(k)]
+        tasks = [(rows[w * step:(w + 1) * step],
+                  msg_idxs[w * step:(w + 1) * step], str(parts[w]), ctx)
+                 for w in range(k)]
+        try:
+            with multiprocessing.Pool(k) as pool:
+                pool.starmap(_convert_chunk, tasks)
+            with out_path.open('wb', buffering=1 << 20) as out:
+                for part in parts:
+                    out.write(part.read_bytes())
+        finally:
+            for part in parts:
+                part.unlink(missing_ok=True)
+    else:
+        with out_path.open('wb', buffering=1 << 20) as out:
+            _render_rows(rows, msg_idxs, out, ctx)
+
+    print(f"Wrote {len(rows)} records to {out_path}")
+    return 0
+
+
+def _render_rows(rows, msg_idxs, out, ctx):
+    """Render pre-sorted, padded CSV rows to the binary stream ``out``.
+
+    ``ctx`` bundles the layout- and header-derived constants computed once in
+    convert(); rendering depends on nothing else, so contiguous chunks of
+    rows can be processed independently by worker processes.
+    """
+    (prog_i, ptt_i, sat_i, date_i, comp_i, sensor_idxs,
+     header_fmt, line_templates, fallback_spans, blank) = ctx
+    # Local bindings: LOAD_FAST instead of a globals lookup per field.
+    _fmt = fmt_exp_field
+    _place = place_into_line
+    # One line buffer reused across all rows; cleared before each line.
+    buf = bytearray(blank)
+    # Lines accumulate here and are written out in ~64KB batches.
+    chunk = bytearray()
+    for row, msg_index in zip(rows, msg_idxs):
+        sat = row[sat_i].strip()
+        try:
+            header = header_fmt % (int(row[prog_i] or 0),
+                                   int(row[ptt_i] or 0),
+                                   msg_index, sat)
+        except ValueError:
+            # non-numeric Program/PTT: fall back to plain zero-padding
+            program = row[prog_i].zfill(5)
+            ptt = row[ptt_i].zfill(6)
+            header = (f"{program} {ptt}  {str(msg_index).rjust(3)} "
+                      f"{str(SENSOR_COUNT).rjust(2)} {sat.ljust(1)}")
+        chunk += header.encode('ascii', 'replace')
+        chunk += b'\n'
+
+        sensors = [row[j] for j in sensor_idxs]
+        msgdate = row[date_i]
+        dt_date = '0000-00-00'; dt_time = '00:00:00'
+        if msgdate:
             try:
-                if msgdate:
-                    datepart, timepart = msgdate.split()
-                    d, m, y = datepart.split('/')
-                    dt_date = f"{y.zfill(4)}-{m.zfill(2)}-{d.zfill(2)}"
-                    hhmm = timepart.split(':')
-                    if len(hhmm) == 2:
-                        dt_time = f"{hhmm[0].zfill(2)}:{hhmm[1].zfill(2)}:00"
-                    else:
-                        dt_time = ':'.join([p.zfill(2) for p in hhmm])
-            except Exception:
-                pass
-
-            sens_idx = 0
-            li = 0
-            while sens_idx < len(sensors) and li < len(line_spans):
-                buf = [' '] * layout.get('line_length', 78)
-                spans = line_spans[li]
-                if li == 0:
-                    place_into_line(buf, (7, 16), dt_date)
-                    place_into_line(buf, (18, 25), dt_time)
-                    comp = row.get('Compression index', '') or '1'
-                    place_into_line(buf, (28, 28), str(comp))
-                for span in spans:
-                    if sens_idx < len(sensors):
-                        v = sensors[sens_idx]
-                        if v in (None, ''):
-                            v = 0
-                        w = span[1] - span[0] + 1
-                        txt = fmt_exp_field(v, width=w)
-                        place_into_line(buf, span, txt)
-                        sens_idx += 1
-                    else:
-                        break
-                out.write(''.join(buf).rstrip() + '\n')
-                li += 1
-
-            while sens_idx < len(sensors):
-                buf = [' '] * layout.get('line_length', 78)
-                fallback_spans = [(7, 16), (18, 25), (28, 36), (37, 45), (46, 54), (55, 63)]
-                for span in fallback_spans:
-                    if sens_idx >= len(sensors):
-                        break
+                dt = datetime.strptime(msgdate, '%d/%m/%Y %H:%M')
+                dt_time = dt.strftime('%H:%M:00')
+            except ValueError:
+                try:
+                    dt = datetime.strptime(msgdate, '%d/%m/%Y %H:%M:%S')
+                    dt_time = dt.strftime('%H:%M:%S')
+                except ValueError:
+                    dt = None
+            if dt is not None:
+                dt_date = dt.strftime('%Y-%m-%d')
+
+        sens_idx = 0
+        for tmpl, slots in line_templates:
+            vals = []
+            for kind, w in slots:
+                if kind == 'sensor':
                     v = sensors[sens_idx]
                     if v in (None, ''):
                         v = 0
-                    w = span[1] - span[0] + 1
-                    txt = fmt_exp_field(v, width=w)
-                    place_into_line(buf, span, txt)
+                    vals.append(_fmt(v, width=w))
                     sens_idx += 1
-                out.write(''.join(buf).rstrip() + '\n')
-            row_count += 1
+                elif kind == 'date':
+                    vals.append(dt_date)
+                elif kind == 'time':
+                    vals.append(dt_time)
+                else:
+                    vals.append(row[comp_i] or '1')
+            chunk += (tmpl % tuple(vals)).encode('ascii', 'replace')
+            chunk += b'\n'
 
-    print(f"Wrote {row_count} records to {out_path}")
-    return 0
+        while sens_idx < len(sensors):
+            buf[:] = blank
+            max_end = 0
+            for start0, w in fallback_spans:
+                if sens_idx >= len(sensors):
+                    break
+                v = sensors[sens_idx]
+                if v in (None, ''):
+                    v = 0
+                txt = _fmt(v, width=w)
+                end = _place(buf, start0, w, txt)
+                if end > max_end:
+                    max_end = end
+                sens_idx += 1
+            chunk += buf[:max_end]
+            chunk += b'\n'
+
+        # Whole records go out in one piece; flush at record boundaries.
+        if len(chunk) > 65536:
+            out.write(chunk)
+            chunk.clear()
+
+    if chunk:
+        out.write(chunk)
+
+
+def _convert_chunk(rows, msg_idxs, part_path, ctx):
+    """Pool worker: render one chunk of rows to its own part file."""
+    with open(part_path, 'wb', buffering=1 << 20) as out:
+        _render_rows(rows, msg_idxs, out, ctx)
 
 
 if __name__ == '__main__':
-    csvp = Path(sys.argv[1]) if len(sys.argv) > 1 else CSV_DEFAULT
-    outp = Path(sys.argv[2]) if len(sys.argv) > 2 else OUT_DEFAULT
-    layoutp = Path(sys.argv[3]) if len(sys.argv) > 3 else LAYOUT_JSON
-    sys.exit(convert(csvp, outp, layoutp))
+    argv = sys.argv[1:]
+    jobs = 1
+    if '--jobs' in argv:
+        i = argv.index('--jobs')
+        try:
+            jobs = int(argv[i + 1])
+        except (IndexError, ValueError):
+            print('Usage: python csv_to_prv.py [input.csv [output.prv '
+                  '[layout.json]]] [--jobs N]')
+            sys.exit(2)
+        del argv[i:i + 2]
+    csvp = Path(argv[0]) if len(argv) > 0 else CSV_DEFAULT
+    outp = Path(argv[1]) if len(argv) > 1 else OUT_DEFAULT
+    layoutp = Path(argv[2]) if len(argv) > 2 else LAYOUT_JSON
+    sys.exit(convert(csvp, outp, layoutp, jobs=jobs))
 